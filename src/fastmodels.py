@@ -1,5 +1,6 @@
-import inspect
+import io
 import sys
+from functools import lru_cache
 from decimal import Decimal
 from datetime import date, time, datetime, timedelta
 from typing import Any, List, Optional, Union, Type, Mapping, Literal, get_args, get_origin
@@ -40,6 +41,7 @@ class Pattern(BaseHtmlType): pass
 # -- Validator Types ---
 class IPv4(BaseHtmlType): pass
 class IPv6(BaseHtmlType): pass
+class CreditCard(BaseHtmlType): pass
 
 # -- Convenience Types ---
 class Int(BaseHtmlType): pass
@@ -48,10 +50,13 @@ class Money(BaseHtmlType): pass
 class Choices(BaseHtmlType): pass
 
 # --- Helpers ---
+# Frozen template; get_kwargs() hands out copies since handlers mutate the result
+_NULL_BLANK = {'null': True, 'blank': True}
+
 def get_kwargs(default_val):
     """Extracts standard Django field kwargs from the default value."""
     if default_val is None: 
-        return {'null': True, 'blank': True}
+        return {**_NULL_BLANK}
     if default_val is not ...: 
         return {'default': default_val}
     return {}
@@ -179,24 +184,33 @@ def handle_relation(typ, default, name, slice_args=None):
     if typ is M2M: return models.ManyToManyField(target, **kwargs)
     return None
 
-# --- The Lookup Table ---
-handlers = [
-    str, int, float, bool, date, time, datetime, Decimal
-]
-
-func_types = {
-    as_text_like: [Text, Password, Email, IPv4, IPv6, Url, Hidden, Color],
-    as_text_area: [TextArea],
-    as_num_range: [Number, Range],
-    as_file_image: [File, Image],
-    handle_relation: [FK, M2M, OTO],
-    lambda t, d, n, s: models.DurationField(**get_kwargs(d)): [timedelta],
-}
-func_types.update({locals()['handle_' + typ.__name__]: [typ] for typ in handlers})
+# --- Additional Handlers ---
 
-TYPES_TO_FUNCTIONS = {t: f for f, types in func_types.items() for t in types}
+def as_pattern(typ, default, name, slice_args=None):
+    """Handles Pattern types (Regex validation)."""
+    kwargs = get_kwargs(default)
+    # In a real scenario, the regex pattern might be passed via the type or default
+    # For this spec, Pattern is a marker. We assume CharField.
+    kwargs.setdefault('max_length', 255)
+    # We could add a RegexValidator here if the pattern was provided
+    return models.CharField(**kwargs)
 
+def as_money(typ, default, name, slice_args=None):
+    """Handles Money types (Decimal with specific defaults)."""
+    kwargs = get_kwargs(default)
+    start, stop, step = parse_slice(slice_args)
+    
+    kwargs.setdefault('max_digits', 19)
+    kwargs.setdefault('decimal_places', 2)
+    kwargs.setdefault('default', Decimal('0.00'))
+    
+    validators_list = kwargs.setdefault('validators', [])
+    if start is not None: validators_list.append(validators.MinValueValidator(start))
+    if stop is not None: validators_list.append(validators.MaxValueValidator(stop))
+    
+    return models.DecimalField(**kwargs)
 
+# --- The Lookup Table ---
 FIELD_HANDLERS = {
     # Primitives
     str: handle_str,
@@ -212,7 +226,7 @@ FIELD_HANDLERS = {
     
     # Financials
     Decimal: handle_decimal,
-    Money: as_decimal_like,
+    Money: as_money,
 
     # HTML / Complex Groups
     Text: as_text_like,
@@ -236,20 +250,89 @@ FIELD_HANDLERS = {
     OTO: handle_relation,
 
     # Additional Validators
-    Pattern: as_text_like
+    Pattern: as_pattern,
+    IPv4: as_text_like,
+    IPv6: as_text_like,
+    CreditCard: as_text_like,  # Reuse as_text_like for CharField + validators
 }
 
+# Flat dispatch table keyed by id(type), consulted by create_field()
+_HANDLERS_BY_ID = {id(t): f for t, f in FIELD_HANDLERS.items()}
+
+# Relation fields can't be deconstruct()ed while models are still loading
+# (swappable_setting needs the app registry), so they skip the recipe cache
+_UNCACHED_IDS = frozenset({id(FK), id(M2M), id(OTO)})
+
+def _freeze_slice(slice_args):
+    """Makes slice args hashable (slice objects aren't before Python 3.12)."""
+    if slice_args.__class__ is slice:
+        return (slice, slice_args.start, slice_args.stop, slice_args.step)
+    return slice_args
+
+def _split_type(typ):
+    """Text[:100] -> (Text, slice(None, 100)); plain types -> (typ, None)."""
+    if typ.__class__ is tuple and len(typ) == 2:
+        return typ
+    return typ, None
+
+def _fresh_kwargs(kwargs):
+    """Copy mutable kwargs (validators, choices) so fields never share lists."""
+    return {k: list(v) if v.__class__ is list else v for k, v in kwargs.items()}
+
+def _thaw_slice(slice_key):
+    if slice_key.__class__ is tuple and slice_key and slice_key[0] is slice:
+        return slice(*slice_key[1:])
+    return slice_key
+
+@lru_cache(maxsize=4096)
+def _build_field_args(base_type, slice_key, default_type, default_repr, default_val, name):
+    """
+    Builds a field once and returns its construction recipe.
+    Django fields can't be shared between models, but their args can.
+    default_repr is part of the key because equal defaults can differ
+    (Decimal('1.0') == Decimal('1.00'), 0.0 == -0.0).
+    """
+    field = _create_field(base_type, default_val, name, _thaw_slice(slice_key))
+    if field is None:
+        return None
+    _, _, args, kwargs = field.deconstruct()
+    return (
+        field.__class__, tuple(args), kwargs,
+        getattr(field, '_fast_widget', None),
+        getattr(field, '_fast_widget_attrs', None),
+    )
+
 def create_field(typ, default_val, name):
     """
     Dispatcher function using the lookup table.
+    Results are memoized by field shape; unhashable defaults bypass the cache.
     """
     # 1. Handle Sliceable Types (e.g. Text[:100])
-    is_slice = isinstance(typ, tuple) and len(typ) == 2
-    base_type = typ[0] if is_slice else typ
-    slice_args = typ[1] if is_slice else None
+    base_type, slice_args = _split_type(typ)
+
+    if id(base_type) in _UNCACHED_IDS:
+        return _create_field(base_type, default_val, name, slice_args)
+
+    slice_key = _freeze_slice(slice_args)
+    try:
+        hash((base_type, slice_key, default_val))
+    except TypeError:
+        return _create_field(base_type, default_val, name, slice_args)
+
+    recipe = _build_field_args(base_type, slice_key, type(default_val), repr(default_val), default_val, name)
+    if recipe is None:
+        return None
+    field_cls, args, kwargs, widget, widget_attrs = recipe
+    field = field_cls(*args, **_fresh_kwargs(kwargs))
+    if widget is not None:
+        field._fast_widget = widget
+    if widget_attrs is not None:
+        field._fast_widget_attrs = widget_attrs
+    return field
 
-    # 2. Direct Lookup
-    handler = FIELD_HANDLERS.get(base_type)
+def _create_field(base_type, default_val, name, slice_args):
+    # 2. Direct Lookup (id-keyed; marker classes are module-level singletons)
+    handler = _HANDLERS_BY_ID.get(id(base_type))
     if handler:
         return handler(base_type, default_val, name, slice_args)
 
@@ -277,96 +360,44 @@ def create_field(typ, default_val, name):
 
     return models.CharField(max_length=255)
 
-def create_model_form(model_class):
-    """Generates a ModelForm with custom widget attachments."""
-    widgets = {}
-    for name, field in model_class.__dict__.items():
-        if hasattr(field, '_fast_widget') and field._fast_widget:
-            widgets[name] = field._fast_widget
-            # Apply widget attrs (like rows) if present
-            if hasattr(field, '_fast_widget_attrs'):
-                # In real Django, we'd instantiate the widget with attrs here
-                # For simplicity, we map the class, but in production code:
-                # widgets[name] = field._fast_widget(attrs=field._fast_widget_attrs)
-                pass
-
-    class Meta:
-        model = model_class
-        fields = '__all__'
-        if widgets:
-            widgets = widgets
-
-    name = f"{model_class.__name__}Form"
-    return type(name, (forms.ModelForm,), {'Meta': Meta})
-
 def model(cls):
     """Decorator to convert class to Django Model."""
     annotations = getattr(cls, '__annotations__', {})
     class_dict = {'__module__': cls.__module__}
     
+    widget_fields = []
     for name, typ in annotations.items():
         default_val = getattr(cls, name, ...)
         django_field = create_field(typ, default_val, name)
         if django_field:
             class_dict[name] = django_field
+            if getattr(django_field, '_fast_widget', None):
+                widget_fields.append(name)
+    class_dict['_fast_widget_fields'] = widget_fields  # Read by create_model_form
             
     new_class = type(cls.__name__, (models.Model,), class_dict)
     new_class.Form = create_model_form(new_class)
     return new_class
 
-# --- Additional Handlers ---
-
-def as_pattern(typ, default, name, slice_args=None):
-    """Handles Pattern types (Regex validation)."""
-    kwargs = get_kwargs(default)
-    # In a real scenario, the regex pattern might be passed via the type or default
-    # For this spec, Pattern is a marker. We assume CharField.
-    kwargs.setdefault('max_length', 255)
-    # We could add a RegexValidator here if the pattern was provided
-    return models.CharField(**kwargs)
-
-def as_money(typ, default, name, slice_args=None):
-    """Handles Money types (Decimal with specific defaults)."""
-    kwargs = get_kwargs(default)
-    start, stop, step = parse_slice(slice_args)
-    
-    kwargs.setdefault('max_digits', 19)
-    kwargs.setdefault('decimal_places', 2)
-    kwargs.setdefault('default', Decimal('0.00'))
-    
-    validators_list = kwargs.setdefault('validators', [])
-    if start is not None: validators_list.append(validators.MinValueValidator(start))
-    if stop is not None: validators_list.append(validators.MaxValueValidator(stop))
-    
-    return models.DecimalField(**kwargs)
-
-# --- Updating the Lookup Table ---
-# We extend the previous dictionary with these new
-# --- Updating the Lookup Table ---
-# We extend the previous dictionary with these new handlers
-FIELD_HANDLERS.update({
-    Pattern: as_pattern,
-    Money: as_money,
-    CreditCard: as_text_like,  # Reuse as_text_like for CharField + validators
-})
-
 def create_model_form(model_class):
     """Generates a ModelForm with custom widget attachments."""
     widgets = {}
-    for name, field in model_class.__dict__.items():
-        if hasattr(field, '_fast_widget') and field._fast_widget:
-            widget_class = field._fast_widget
-            # If widget attributes are specified (e.g., rows for TextArea), instantiate the widget
-            if hasattr(field, '_fast_widget_attrs'):
-                widgets[name] = widget_class(attrs=field._fast_widget_attrs)
-            else:
-                widgets[name] = widget_class
+    # Only the fields model() tagged with a widget need visiting
+    for name in getattr(model_class, '_fast_widget_fields', ()):
+        field = model_class._meta.get_field(name)
+        widget_class = field._fast_widget
+        # If widget attributes are specified (e.g., rows for TextArea), instantiate the widget
+        widget_attrs = getattr(field, '_fast_widget_attrs', None)
+        if widget_attrs is not None:
+            widgets[name] = widget_class(attrs=widget_attrs)
+        else:
+            widgets[name] = widget_class
 
     class Meta:
         model = model_class
         fields = '__all__'
-        if widgets:
-            widgets = widgets
+    if widgets:
+        Meta.widgets = widgets
 
     name = f"{model_class.__name__}Form"
     return type(name, (forms.ModelForm,), {'Meta': Meta})
@@ -375,27 +406,51 @@ def create_model_form(model_class):
 # FAST MODELS EXPORTER
 # ----------------------------------------------------------------------
 
+def _fmt_str(val):
+    return f"'{val}'"
+
+def _slow_format(val):
+    """Fallback for types missing from _FMT (model classes, enums, subclasses)."""
+    if isinstance(val, str):
+        return _fmt_str(val)
+    # Plain isinstance(val, type): inspect.isclass adds a call and module lookup per value
+    if isinstance(val, type) and issubclass(val, models.Model):
+        return f"'{val.__name__}'"
+    return repr(val)
+
+# Exact-type formatters for the common kwarg values
+_FMT = {
+    str: _fmt_str,
+    int: repr,
+    float: repr,
+    bool: repr,
+    Decimal: repr,
+    type(None): repr,
+}
+
 def format_value(val):
     """
     Helper to format values for code generation.
     Handles strings, classes, and enums gracefully.
     """
-    if isinstance(val, str):
-        return f"'{val}'"
-    if inspect.isclass(val) and issubclass(val, models.Model):
-        return f"'{val.__name__}'"
-    return repr(val)
+    return (_FMT.get(type(val)) or _slow_format)(val)
 
+@lru_cache(maxsize=None)
 def generate_model_code(model_class):
     """
     Introspects a Django model class (created via fastmodels or otherwise)
     and returns a string containing the standard Django class definition.
+    The output is cached per class; use generate_model_code.cache_clear() to reset.
     """
+    return _generate_model_code_uncached(model_class)
+
+def _generate_model_code_uncached(model_class):
     class_name = model_class.__name__
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
     
     # 1. Class Definition
-    lines.append(f"class {class_name}(models.Model):")
+    write(f"class {class_name}(models.Model):\n")
     
     # 2. Iterate over fields
     # We use local_fields to get standard fields and local_many_to_many for M2M
@@ -411,14 +466,12 @@ def generate_model_code(model_class):
         name, path, args, kwargs = field.deconstruct()
         
         # Clean up the field type name (e.g., 'django.db.models.CharField' -> 'models.CharField')
-        field_type = path.split('.')[-1]
+        field_type = path.rpartition('.')[2]
         
         # Construct the arguments string
-        arg_strings = []
-        
         # Handle positional args (rare in modern Django, but possible)
-        for arg in args:
-            arg_strings.append(format_value(arg))
+        arg_strings = [format_value(arg) for arg in args]
+        append = arg_strings.append
             
         # Handle keyword args
         for k, v in kwargs.items():
@@ -426,17 +479,16 @@ def generate_model_code(model_class):
             if k in ['to', 'model']: 
                 if hasattr(v, '__name__'):
                     v = v.__name__
-                arg_strings.append(f"{k}='{v}'")
+                append(f"{k}='{v}'")
             # Special handling for choices to format them nicely
             elif k == 'choices':
                 # We output the list of tuples directly
-                arg_strings.append(f"{k}={v}")
+                append(f"{k}={v}")
             else:
-                arg_strings.append(f"{k}={format_value(v)}")
+                append(f"{k}={format_value(v)}")
         
         # Join everything
-        field_def = f"    {field.name} = models.{field_type}({', '.join(arg_strings)})"
-        lines.append(field_def)
+        write(f"    {field.name} = models.{field_type}({', '.join(arg_strings)})\n")
 
     # 3. Handle Meta (Optional, but good for completeness)
     meta_options = []
@@ -446,17 +498,16 @@ def generate_model_code(model_class):
         meta_options.append(f"        verbose_name_plural = '{model_class._meta.verbose_name_plural}'")
         
     if meta_options:
-        lines.append("")
-        lines.append("    class Meta:")
-        lines.extend(meta_options)
+        write("\n    class Meta:\n")
+        write("\n".join(meta_options))
+        write("\n")
 
     # 4. Add __str__ if it exists and isn't default object.__str__
     # (Hard to reverse engineer dynamic lambdas, but we can add a placeholder)
-    lines.append("")
-    lines.append("    def __str__(self):")
-    lines.append(f"        return str(self.pk)  # TODO: Update this")
+    write("\n    def __str__(self):\n")
+    write("        return str(self.pk)  # TODO: Update this")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 def export_app_models(models_list):
     """
@@ -15,7 +15,7 @@ Key Features:
 Dependencies:
 - Python 3.11+ (for tomllib; use 'pip install tomli' for older versions).
 - fastcore.xml (for FT and HTML tags).
-- Django (for HttpResponse and MiddlewareMixin, if used in a Django context).
+- Django (for HttpResponse; imported lazily by the @ft decorator, so components work without it).
 
 Usage Overview:
 1. Define extensions in 'extensions.toml' (e.g., [bootstrap] html = ["css_url", "js_url"]).
@@ -31,12 +31,13 @@ Example:
     
     # Build HTML
     html_builder = HTML()
-    html_builder.contents = COMPONENT_REGISTRY['alert']('Hello!', level='success')
+    html_builder.contents = COMPONENTS.alert('Hello!', level='success')
     html_builder.extensions = ['bootstrap']
     result = html_builder.to_html()  # Generates full HTML FT
 
 Notes:
-- Components are global and in-memory; import COMPONENT_REGISTRY to access from other modules.
+- Components are global and in-memory; import COMPONENTS (attribute access) or the dict view
+  COMPONENT_REGISTRY to access from other modules.
 - Extensions are loaded at import time; invalid/missing TOML files are ignored.
 - Callables in components must return FT or tuple; invoke manually when assigning to HTML fields.
 - Assumes fastcore.xml provides tags like Div, Meta, etc. (extend as needed).
@@ -45,26 +46,81 @@ Notes:
 Classes and Functions:
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable
+from types import SimpleNamespace
+from typing import Any, Callable, Sequence
 import functools
+import logging
 import tomllib  # Use 'import tomli as tomllib' if on Python < 3.11
 
-from django.utils.deprecation import MiddlewareMixin
-from django.http import HttpResponse
 from fastcore.xml import FT, Body, Div, Head, Html, Link, Meta, Script, to_xml
 
-# Load extensions from TOML file (defaults to empty dict if file missing/invalid)
-EXTENSIONS = {}
-try:
-    with open('extensions.toml', 'rb') as f:
-        EXTENSIONS = tomllib.load(f)
-except (FileNotFoundError, tomllib.TOMLKitError):
-    pass  # Silently ignore; extensions will be empty
+logger = logging.getLogger(__name__)
 
-# Global component catalog
-COMPONENT_REGISTRY = {}
+def load_extensions(path: str = 'extensions.toml') -> dict:
+    """Load extensions from a TOML file (empty dict if the file is missing/invalid)."""
+    try:
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        return {}  # Silently ignore; extensions will be empty
+
+EXTENSIONS = load_extensions()
+
+# URL suffix -> header tag factory
+_SUFFIX_HANDLERS = {
+    'css': lambda url: Link(rel='stylesheet', href=url),
+    'js': lambda url: Script(src=url),
+    'mjs': lambda url: Script(src=url, type='module'),
+}
+
+def _build_ext_headers(extensions: dict) -> dict[str, tuple[FT, ...]]:
+    """
+    Pre-render each extension's CSS/JS URLs into Link/Script tags.
+    Unsupported entries are skipped and reported here, once, rather than per render.
+    """
+    ext_headers = {}
+    for name, ext in extensions.items():
+        if not isinstance(ext, dict):
+            logger.warning("Skipping extension %r: expected a table, got %s", name, type(ext).__name__)
+            continue
+        urls = ext.get('html', [])
+        if not isinstance(urls, list):
+            logger.warning("Skipping extension %r: 'html' must be a list of URLs", name)
+            continue
+        headers = []
+        for url in urls:
+            handler = _SUFFIX_HANDLERS.get(url.rpartition('.')[2].lower()) if isinstance(url, str) else None
+            if handler:
+                headers.append(handler(url))
+            else:
+                logger.warning("Skipping unsupported URL %r in extension %r", url, name)
+        ext_headers[name] = tuple(headers)
+    return ext_headers
+
+# Extension name -> ready-made header tags, built once at import
+_EXT_HEADERS = _build_ext_headers(EXTENSIONS)
+
+# Global component catalog (attribute access: COMPONENTS.alert)
+COMPONENTS = SimpleNamespace()
+# Backward-compatible dict view over the same storage
+COMPONENT_REGISTRY = COMPONENTS.__dict__
+# Component name -> one-line description, computed once at registration
+_COMPONENT_DESCS = {}
+
+def _extract_desc(comp: Any) -> str:
+    """First paragraph of a dynamic component's docstring, whitespace-collapsed."""
+    if isinstance(comp, (FT, tuple)):  # Static components carry no docstring of their own
+        return ''
+    doc = getattr(comp, '__doc__', None)
+    if not doc:
+        return ''
+    return ' '.join(doc.strip().split('\n\n', 1)[0].split())
+
+def _store_component(name: str, comp: Any):
+    setattr(COMPONENTS, name, comp)
+    _COMPONENT_DESCS[name] = _extract_desc(comp)
 
 def register_component(name: str, component: Any = None):
     """
@@ -90,17 +146,21 @@ def register_component(name: str, component: Any = None):
             return FT(tag='a', children=[text], href=href, **attrs)
         
         # Access and use
-        COMPONENT_REGISTRY['footer']  # Static FT
-        COMPONENT_REGISTRY['button']('Click', href='/url', cls='btn')  # Invoke callable
+        COMPONENTS.footer  # Static FT
+        COMPONENTS.button('Click', href='/url', cls='btn')  # Invoke callable
     """
     def decorator(comp):
-        COMPONENT_REGISTRY[name] = comp
+        _store_component(name, comp)
         return comp
     if component is not None:
-        COMPONENT_REGISTRY[name] = component
+        _store_component(name, component)
         return component
     return decorator
 
+def list_components() -> dict[str, str]:
+    """Return a {name: description} mapping of registered components (descriptions come from docstrings)."""
+    return dict(_COMPONENT_DESCS)
+
 REGISTRY = {}
 
 def ft(path=None, *decorator_args, **decorator_kwargs):
@@ -134,13 +194,20 @@ def ft(path=None, *decorator_args, **decorator_kwargs):
         # Register the view
         REGISTRY[final_path] = original_func
         
+        # Deferred so `import fasttags` doesn't pull in Django for component-only use
+        from django.http import HttpResponse
+        
+        # Bind hot names as closure locals instead of module globals
+        render, response_cls = to_xml, HttpResponse
+        
         # Preserve metadata and support chaining
         @functools.wraps(original_func)
         def wrapper(*args, **kwargs):
             result = original_func(*args, **kwargs)
-            if isinstance(result, (FT, tuple)):
-                rendered_xml = to_xml(result)
-                return HttpResponse(rendered_xml, content_type='text/html')
+            result_type = type(result)
+            if result_type is FT or result_type is tuple:
+                rendered_xml = render(result)
+                return response_cls(rendered_xml, content_type='text/html')
             return result
         
         wrapper.__wrapped__ = original_func
@@ -150,7 +217,58 @@ def ft(path=None, *decorator_args, **decorator_kwargs):
     
     return decorator
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _head_children(extensions: tuple, hdrs: tuple, encoding: FT, viewport: FT) -> tuple:
+    """
+    Resolve (and memoize) the <head> children for a given set of headers and extensions.
+    FT nodes hash by identity, so the same header objects reuse the same tuple.
+    Only the immutable tuple is cached; each page gets its own Head (see HTML.add_hdrs).
+    """
+    ext_tags = []
+    for ext in extensions:
+        tags = _EXT_HEADERS.get(ext)
+        if tags is None:
+            logger.warning("Unknown extension %r (not in extensions.toml)", ext)  # Once per cached head
+        else:
+            ext_tags.extend(tags)
+    
+    # Standard + user headers first, extensions at the end
+    return (encoding, viewport, *hdrs, *ext_tags)
+
+# --- HTML.to_html() wrappers, dispatched on the top-level tag of `contents` ---
+def _wrap_html(page: 'HTML') -> FT:
+    return page.contents
+
+def _wrap_head(page: 'HTML') -> FT:
+    return Html(page.contents, lang=page.language)
+
+def _wrap_body(page: 'HTML') -> FT:
+    return Html(
+        page.add_hdrs(),
+        page.contents,
+        lang=page.language
+    )
+
+def _wrap_default(page: 'HTML') -> FT:
+    # Default: wrap in Html with Head and Body
+    return Html(
+        page.add_hdrs(),
+        # Copy rather than call page.body: the default Body is shared by all instances
+        Body(*page.body.children, page.contents, *page.ftrs, **page.body.attrs),
+        lang=page.language
+    )
+
+_TAG_DISPATCH = {'html': _wrap_html, 'head': _wrap_head, 'body': _wrap_body}
+
+# Shared, read-only defaults for HTML fields (no per-instance allocation).
+# These nodes are reused by every page (and every cached Head) - never mutate them.
+_EMPTY = ()
+_DEFAULT_ENCODING = Meta(charset='utf-8')
+_DEFAULT_VIEWPORT = Meta(name='viewport', content='width=device-width, initial-scale=1.0')
+_DEFAULT_BODY = Body()
+_DEFAULT_CONTENTS = Div()
+
+@dataclass(slots=True, eq=False)
 class HTML:
     """
     Dataclass for building HTML pages with headers, body, and extensions.
@@ -160,10 +278,14 @@ class HTML:
         encoding (FT): Meta charset tag.
         viewport (FT): Meta viewport tag.
         body (FT): Body tag (default: empty Body()).
-        hdrs (list[Any]): Additional header elements (e.g., Meta tags).
+        hdrs (Sequence[Any]): Additional header elements (e.g., Meta tags).
         contents (FT): Main content (default: empty Div; can be FT, tuple, or component).
-        ftrs (list[Any]): Footer elements (e.g., components).
-        extensions (list[str]): List of extension names from TOML to load (e.g., ['bootstrap']).
+        ftrs (Sequence[Any]): Footer elements (e.g., components).
+        extensions (Sequence[str]): List of extension names from TOML to load (e.g., ['bootstrap']).
+    
+    Attributes are slots (no per-instance __dict__), so only the fields above can be set.
+    hdrs/ftrs/extensions default to a shared empty tuple; assign a list, or use
+    _mut_list('hdrs') to get an appendable copy.
     
     Methods:
         add_hdrs(): Builds the <head> with encoding, viewport, hdrs, and extensions (CSS/JS links).
@@ -171,55 +293,41 @@ class HTML:
     
     Usage:
         html_builder = HTML()
-        html_builder.contents = COMPONENT_REGISTRY['alert']('Message')
+        html_builder.contents = COMPONENTS.alert('Message')
         html_builder.extensions = ['jquery']
         html = html_builder.to_html()  # FT object for rendering
     """
     language: str = 'en'
-    encoding: FT = Meta(charset='utf-8')
-    viewport: FT = Meta(content='width=device-width, initial-scale=1.0')
-    body: FT = Body()
-    hdrs: list[Any] = field(default_factory=list)
-    contents: FT = Div()  # Default to an empty div if not set; can be overridden
-    ftrs: list[Any] = field(default_factory=list)
-    extensions: list[str] = field(default_factory=list)  # List of shortcut names from TOML
+    encoding: FT = _DEFAULT_ENCODING
+    viewport: FT = _DEFAULT_VIEWPORT
+    body: FT = _DEFAULT_BODY
+    hdrs: Sequence[Any] = _EMPTY
+    contents: FT = _DEFAULT_CONTENTS  # Default to an empty div if not set; can be overridden
+    ftrs: Sequence[Any] = _EMPTY
+    extensions: Sequence[str] = _EMPTY  # List of shortcut names from TOML
+
+    def _mut_list(self, attr: str) -> list:
+        """Return the `hdrs`/`ftrs`/`extensions` field as a list, copying the shared default on first mutation."""
+        value = getattr(self, attr)
+        if value.__class__ is not list:
+            value = list(value)
+            setattr(self, attr, value)
+        return value
 
     def add_hdrs(self) -> FT:
-        headers = [self.encoding, self.viewport, *self.hdrs]  # Standard + user headers first
-        
-        # Add extensions at the end
-        for ext in self.extensions:
-            if ext in EXTENSIONS:
-                for url in EXTENSIONS[ext]['html']:
-                    if url.endswith('.css'):
-                        headers.append(Link(rel='stylesheet', href=url))
-                    elif url.endswith('.js'):
-                        headers.append(Script(src=url))
-                    # Skip if not .css or .js
-        
-        return Head(*headers)
+        key = (tuple(self.extensions), tuple(self.hdrs), self.encoding, self.viewport)
+        try:
+            children = _head_children(*key)
+        except TypeError:  # Unhashable user header; resolve without caching
+            children = _head_children.__wrapped__(*key)
+        return Head(*children)  # Fresh node: mutating one page's head can't leak into others
 
     def to_html(self) -> FT:
         '''Wrap a Fast Tag in HTML, Head, and/or Body tags if not provided.'''
-        if isinstance(self.contents, FT):
-            match self.contents.tag:
-                case 'html':
-                    return self.contents
-                case 'head':
-                    return Html(self.contents, lang=self.language)
-                case 'body':
-                    return Html(
-                        self.add_hdrs(),
-                        self.contents,
-                        lang=self.language
-                    )
-
-        # Default: wrap in Html with Head and Body
-        return Html(
-            self.add_hdrs(),
-            self.body(self.contents, *self.ftrs),
-            lang=self.language
-        )
+        contents = self.contents
+        # Tuple contents never carry a tag; skip getattr's AttributeError round-trip
+        tag = None if type(contents) is tuple else getattr(contents, 'tag', None)
+        return _TAG_DISPATCH.get(tag, _wrap_default)(self)
 
 if __name__ == '__main__':
     # Example: Register components
@@ -230,8 +338,8 @@ if __name__ == '__main__':
     
     # Example: Use in HTML builder
     html_builder = HTML()
-    html_builder.contents = COMPONENT_REGISTRY['alert']('Hello World')
-    html_builder.hdrs.append(Meta(name='author', content='Me'))
+    html_builder.contents = COMPONENTS.alert('Hello World')
+    html_builder._mut_list('hdrs').append(Meta(name='author', content='Me'))
     html_builder.extensions = ['bootstrap']  # Load extensions
     result = html_builder.to_html()
     print(result)  # Outputs the full HTML FT structure
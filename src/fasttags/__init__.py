@@ -1,7 +1,7 @@
 from .core import *
 from .elements import FT, ft, HTML_TAGS, VOID_ELEMENTS
 from .attributes import keymap, attrmap, to_attr, to_attrs
-from .rendering import to_xml, to_html, tidy, highlight, showtags
+from .rendering import to_xml, to_xml_bytes, to_html, tidy, highlight, showtags
 from .utilities import flatten, as_json, add_quotes
 from .validation import warn_void_override
 from .parsing import html2ft
@@ -12,7 +12,7 @@ from .config import config
 __all__ = [
     'FastTag', 'SafeHtml', 'FT', 'ft', 'HTML_TAGS', 'VOID_ELEMENTS',
     'keymap', 'attrmap', 'to_attr', 'to_attrs',
-    'to_xml', 'to_html', 'tidy', 'highlight', 'showtags',
+    'to_xml', 'to_xml_bytes', 'to_html', 'tidy', 'highlight', 'showtags',
     'flatten', 'as_json', 'add_quotes',
     'warn_void_override', 'html2ft', 'config',
 ]
@@ -1,9 +1,11 @@
 from collections.abc import Mapping, Iterable
+from functools import lru_cache
 from .core import AttrValue, SafeHtml
 from .utilities import add_quotes
 
 SPECIAL_CHARS = {'-', ':', '.'}
 
+@lru_cache(maxsize=2048)
 def keymap(key: str) -> str:
     if not key:
         return '_'
@@ -15,26 +17,85 @@ def keymap(key: str) -> str:
         return key
     return key.replace('_', '-')
 
+# Most common attribute names, pre-mapped at import so first renders hit the cache
+_COMMON_KEYS = (
+    'id', 'cls', 'class', 'style', 'title', 'lang', 'dir', 'hidden', 'tabindex',
+    'href', 'src', 'alt', 'rel', 'target', 'type', 'name', 'value', 'content',
+    'charset', 'placeholder', 'action', 'method', 'enctype', 'for_', 'fr',
+    'checked', 'selected', 'disabled', 'readonly', 'required', 'multiple',
+    'autofocus', 'autocomplete', 'min', 'max', 'step', 'pattern', 'maxlength',
+    'minlength', 'size', 'rows', 'cols', 'width', 'height', 'colspan', 'rowspan',
+    'role', 'aria_label', 'aria_hidden', 'data_id', 'onclick', 'defer', 'async_',
+    'integrity', 'crossorigin', 'loading', 'srcset', 'sizes', 'media',
+)
+for _key in _COMMON_KEYS:
+    keymap(_key)
+del _key
+
 def attrmap(attrs: dict[str, object]) -> dict[str, object]:
+    """Map keys to HTML form; returns `attrs` itself when no key changes."""
+    for k in attrs:
+        if keymap(k) is not k:
+            break
+    else:
+        return attrs
     return {keymap(k): v for k, v in attrs.items()}
 
+def _h_str(value) -> str:
+    return value
+
+def _h_safe(value) -> str:
+    return value.__html__()
+
+def _h_mapping(value) -> str:
+    # List comprehensions feed str.join faster than generator expressions
+    return '; '.join([f'{k}:{v}' for k, v in value.items()])
+
+def _h_iter(value) -> str:
+    return ' '.join([str(i) for i in value])
+
+# Concrete type -> value formatter; filled in lazily by _resolve()
+_HANDLER_CACHE = {
+    str: _h_str, int: str, float: str,
+    dict: _h_mapping, list: _h_iter, tuple: _h_iter, set: _h_iter, frozenset: _h_iter,
+}
+
+def _resolve(value):
+    """Slow path: pick a formatter by protocol/ABC and memoize it for the concrete type."""
+    if isinstance(value, str):
+        handler = _h_str
+    elif isinstance(value, SafeHtml):
+        handler = _h_safe
+    elif isinstance(value, Mapping):
+        handler = _h_mapping
+    elif isinstance(value, Iterable):
+        handler = _h_iter
+    else:
+        handler = str
+    _HANDLER_CACHE[type(value)] = handler
+    return handler
+
 def to_attr(key: str, value: AttrValue) -> str:
-    match value:
-        case False | None | '':
-            return ''
-        case True:
-            return key
-        case str():
-            val = value
-        case SafeHtml():
-            val = value.__html__()
-        case Mapping():
-            val = '; '.join(f'{k}:{v}' for k, v in value.items())
-        case Iterable():
-            val = ' '.join(str(i) for i in value)
-        case _:
-            val = str(value)
+    # Singletons first: cheaper than hashing the type
+    if value is True:
+        return key
+    if value is False or value is None:
+        return ''
+    handler = _HANDLER_CACHE.get(type(value)) or _resolve(value)
+    val = handler(value)
     return f'{key}={add_quotes(val)}' if val else ''
 
 def to_attrs(attrs: dict[str, AttrValue]) -> str:
-    return ' '.join(filter(None, (to_attr(k, v) for k, v in attrs.items())))
+    if not attrs:
+        return ''
+    _to_attr = to_attr
+    if len(attrs) == 1:
+        (k, v), = attrs.items()
+        return _to_attr(k, v)
+    parts = []
+    append = parts.append
+    for k, v in attrs.items():
+        s = _to_attr(k, v)
+        if s:
+            append(s)
+    return ' '.join(parts)
@@ -1,5 +1,7 @@
 from typing import Protocol, runtime_checkable, Iterable, Mapping, Sequence, Union
 
+# Note: isinstance() against these runtime-checkable Protocols inspects every
+# protocol member on each call. Hot paths should test `type(x) is FT` instead.
 @runtime_checkable
 class FastTag(Protocol):
     tag: str
@@ -26,7 +28,7 @@ AttrValue = Union[
 ]
 
 # HTML5 tags (capitalized)
-HTML_TAGS = {
+HTML_TAGS = frozenset({
     "A", "Abbr", "Address", "Area", "Article", "Aside", "Audio", "B", "Base",
     "Bdi", "Bdo", "Blockquote", "Body", "Br", "Button", "Canvas", "Caption",
     "Cite", "Code", "Col", "Colgroup", "Data", "Datalist", "Dd", "Del", "Details",
@@ -39,13 +41,13 @@ HTML_TAGS = {
     "Section", "Select", "Small", "Source", "Span", "Strong", "Style", "Sub",
     "Summary", "Sup", "Table", "Tbody", "Td", "Template", "Textarea", "Tfoot",
     "Th", "Thead", "Time", "Title", "Tr", "Track", "U", "Ul", "Var", "Video", "Wbr"
-}
+})
 
 # Void elements (self-closing)
-VOID_ELEMENTS = {
+VOID_ELEMENTS = frozenset({
     "Area", "Base", "Br", "Col", "Embed", "Hr", "Img", "Input",
     "Link", "Meta", "Param", "Source", "Track", "Wbr"
-}
+})
 
 class CurativeError(Exception):
     """Custom error with prescription for healing."""
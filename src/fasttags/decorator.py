@@ -1,12 +1,73 @@
 import django.http as http
+import functools
 import logging  # For logging errors
-from fasttags.core import FT  # Import the FastTag class from FastTags
+from fasttags.elements import FT  # Concrete class, so identity checks work (core.FastTag is a Protocol)
 from fasttags.rendering import to_xml  # Import the rendering function
-from fasttags.exceptions import CurativeError  # If available; otherwise, remove or handle generally
+from fasttags.core import CurativeError
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+def _render_ft(response):
+    """Render a single FastTag object."""
+    try:
+        rendered_html = to_xml(response)
+        return http.HttpResponse(rendered_html)
+    except CurativeError as e:  # Specific to FastTags if available
+        logger.error("CurativeError while rendering FastTag: %s", e)
+        return http.HttpResponse("Error rendering FastTag: Invalid or unhealable content.", status=500)
+    except Exception as e:  # General exceptions
+        logger.error("Error rendering FastTag: %s", e)
+        return http.HttpResponse("An error occurred while rendering the FastTag.", status=500)
+
+def _render_list(response):
+    """Handle a list containing FastTag objects."""
+    try:
+        rendered_items = []
+        for item in response:
+            if type(item) is FT:
+                rendered_items.append(to_xml(item))
+            else:
+                rendered_items.append(str(item))  # Or handle differently
+        rendered_html = ''.join(rendered_items)  # Concatenate
+        return http.HttpResponse(rendered_html)
+    except CurativeError as e:
+        logger.error("CurativeError while processing list: %s", e)
+        return http.HttpResponse("Error processing list: Invalid content encountered.", status=500)
+    except Exception as e:
+        logger.error("Error processing list: %s", e)
+        return http.HttpResponse("An error occurred while processing the list.", status=500)
+
+def _render_dict(response):
+    """Handle a dict containing FastTag objects (e.g., render values)."""
+    try:
+        rendered_dict = {}
+        for key, value in response.items():
+            if type(value) is FT:
+                rendered_dict[key] = to_xml(value)
+            else:
+                rendered_dict[key] = str(value)  # Or handle differently
+        rendered_html = ''.join(str(rendered_dict.get(key)) for key in rendered_dict)  # Basic rendering
+        return http.HttpResponse(rendered_html)
+    except CurativeError as e:
+        logger.error("CurativeError while processing dict: %s", e)
+        return http.HttpResponse("Error processing dictionary: Invalid content encountered.", status=500)
+    except Exception as e:
+        logger.error("Error processing dict: %s", e)
+        return http.HttpResponse("An error occurred while processing the dictionary.", status=500)
+
+# Exact response type -> renderer; anything else passes through unchanged
+_RENDERERS = {FT: _render_ft, list: _render_list, dict: _render_dict}
+
+@functools.lru_cache(maxsize=None)
+def _resolve_type(tp):
+    """Slow path for subclasses: walk the MRO once per new type and cache the renderer."""
+    for base in tp.__mro__:
+        renderer = _RENDERERS.get(base)
+        if renderer is not None:
+            return renderer
+    return None
+
 def ft(view_func):
     """
     Django decorator to automatically render FastTag objects returned from a view.
@@ -24,70 +85,25 @@ def ft(view_func):
     
     Note: This is a basic implementation. Customize as needed for your project.
     """
+    @functools.wraps(view_func)
     def wrapper(request, *args, **kwargs):
         try:
             # First, call the view function
             response = view_func(request, *args, **kwargs)
         except Exception as e:
             # Log the exception and return an error response
-            logger.error(f"Exception in view function: {e}")
+            logger.error("Exception in view function: %s", e)
             return http.HttpResponse("An internal server error occurred. Please check the logs.", status=500)
         
         try:
-            if isinstance(response, FT):
-                # Render a single FastTag object
-                try:
-                    rendered_html = to_xml(response)
-                    return http.HttpResponse(rendered_html)
-                except CurativeError as e:  # Specific to FastTags if available
-                    logger.error(f"CurativeError while rendering FastTag: {e}")
-                    return http.HttpResponse("Error rendering FastTag: Invalid or unhealable content.", status=500)
-                except Exception as e:  # General exceptions
-                    logger.error(f"Error rendering FastTag: {e}")
-                    return http.HttpResponse("An error occurred while rendering the FastTag.", status=500)
-            
-            elif isinstance(response, list):
-                # Handle a list containing FastTag objects
-                try:
-                    rendered_items = []
-                    for item in response:
-                        if isinstance(item, FT):
-                            rendered_items.append(to_xml(item))
-                        else:
-                            rendered_items.append(str(item))  # Or handle differently
-                    rendered_html = ''.join(rendered_items)  # Concatenate
-                    return http.HttpResponse(rendered_html)
-                except CurativeError as e:
-                    logger.error(f"CurativeError while processing list: {e}")
-                    return http.HttpResponse("Error processing list: Invalid content encountered.", status=500)
-                except Exception as e:
-                    logger.error(f"Error processing list: {e}")
-                    return http.HttpResponse("An error occurred while processing the list.", status=500)
-            
-            elif isinstance(response, dict):
-                # Handle a dict containing FastTag objects (e.g., render values)
-                try:
-                    rendered_dict = {}
-                    for key, value in response.items():
-                        if isinstance(value, FT):
-                            rendered_dict[key] = to_xml(value)
-                        else:
-                            rendered_dict[key] = str(value)  # Or handle differently
-                    rendered_html = ''.join(str(rendered_dict.get(key)) for key in rendered_dict)  # Basic rendering
-                    return http.HttpResponse(rendered_html)
-                except CurativeError as e:
-                    logger.error(f"CurativeError while processing dict: {e}")
-                    return http.HttpResponse("Error processing dictionary: Invalid content encountered.", status=500)
-                except Exception as e:
-                    logger.error(f"Error processing dict: {e}")
-                    return http.HttpResponse("An error occurred while processing the dictionary.", status=500)
-            
+            response_type = type(response)
+            renderer = _RENDERERS.get(response_type) or _resolve_type(response_type)
             # If the response is not a FastTag, list, or dict, return it as-is
-            return response
+            return renderer(response) if renderer else response
         
         except Exception as e:
             # Catch any unhandled exceptions in the outer try block
-            logger.error(f"Unhandled exception in decorator: {e}")
+            logger.error("Unhandled exception in decorator: %s", e)
             return http.HttpResponse("An internal server error occurred in the decorator.", status=500)
     
     return wrapper
@@ -5,27 +5,48 @@ from .utilities import flatten
 from .validation import warn_void_override
 from .rendering import to_xml
 
+# Lowercase void tags, matching FT.tag (saves a title-case allocation per node)
+_VOID_LOWER = frozenset(e.lower() for e in VOID_ELEMENTS)
+
 class FT:
-    internal_attrs = {
-        'tag', 'children', 'attrs', 'void', 'validate_mode',
-        'list', 'get', 'set',
-        '__getitem__', '__setitem__', '__iter__', '__call__',
-        '__repr__', '__str__', '__html__', '__ft__',
-    }
-
-    def __init__(self, tag: str, *contents: Element, void: bool = False, validate_mode: str = 'none', **attrs):
-        self.tag = tag.lower()
-        expected_void = tag.title() in VOID_ELEMENTS
+    __slots__ = ('tag', 'children', 'attrs', 'void', 'validate_mode')
+    # Slot names are stored on the instance; any other attribute set becomes an HTML attribute
+    internal_attrs = frozenset(__slots__)
+
+    def __init__(self, tag: str, *contents: Element, void: bool = False, validate_mode: str = 'none',
+                 _raw_attrs: dict | None = None, **attrs):
+        # Direct slot writes; skips the __setattr__ trampoline during construction
+        _set = object.__setattr__
+        lower = tag.lower()
+        _set(self, 'tag', lower)
+        expected_void = lower in _VOID_LOWER
         if void != expected_void:
             warn_void_override(tag, void, expected_void)
-        self.void = void
-        self.validate_mode = validate_mode  # Per-instance mode
-        self.children = flatten(contents)
-        self.attrs = attrmap(attrs)
+        _set(self, 'void', void)
+        _set(self, 'validate_mode', validate_mode)  # Per-instance mode
+        _set(self, 'children', flatten(contents))
+        # Trusted callers pass already-normalized keys via _raw_attrs to skip attrmap
+        _set(self, 'attrs', _raw_attrs if _raw_attrs is not None else attrmap(attrs))
+
+    @classmethod
+    def _make(cls, tag: str, children=(), attrs: dict | None = None, void: bool = False,
+              validate_mode: str = 'none') -> 'FT':
+        """
+        Internal fast constructor. The caller guarantees a lowercase tag, already-flat
+        children and keymapped attrs, so flatten/attrmap/void checks are skipped.
+        """
+        self = cls.__new__(cls)
+        _set = object.__setattr__
+        _set(self, 'tag', tag)
+        _set(self, 'void', void)
+        _set(self, 'validate_mode', validate_mode)
+        _set(self, 'children', list(children))
+        _set(self, 'attrs', {} if attrs is None else attrs)
+        return self
 
     def __setattr__(self, key, val):
         if key in FT.internal_attrs:
-            super().__setattr__(key, val)
+            object.__setattr__(self, key, val)
         else:
             self.attrs[keymap(key)] = val
 
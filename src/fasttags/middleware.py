@@ -1,5 +1,7 @@
 # fasttags_middleware.py (place this in your Django app or project)
 
+import functools
+
 from django.http import HttpResponse
 from fasttags import FT, to_xml  # Import FastTag class and renderer
 
@@ -43,9 +45,10 @@ class FastTagsMiddleware:
         """
         Wrap the view function to check if it returns a FastTag and render it.
         """
+        @functools.wraps(view_func)
         def wrapped_view(request, *args, **kwargs):
             response = view_func(request, *args, **kwargs)
-            if isinstance(response, FT):
+            if type(response) is FT:
                 # Render FastTag to HTML string
                 html = to_xml(response)
                 return HttpResponse(html, content_type='text/html; charset=utf-8')
@@ -58,6 +61,7 @@ from django.conf import settings
 from django.http import HttpResponse, HttpResponseServerError
 from django.utils.decorators import decorator_from_middleware
 from fasttags import FT, to_xml  # Import FastTag class and renderer
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -95,11 +99,12 @@ class FastTagsMiddleware:
         if not self.enabled:
             return None  # Skip in non-DEBUG mode
 
+        @functools.wraps(view_func)
         def wrapped_view(request, *args, **kwargs):
             try:
                 response = view_func(request, *args, **kwargs)
-                if isinstance(response, FT):
-                    logger.info(f"Rendering FastTag from view: {view_func.__name__}")
+                if type(response) is FT:
+                    logger.info("Rendering FastTag from view: %s", view_func.__name__)
                     html = to_xml(response)
                     resp = HttpResponse(html, content_type='text/html; charset=utf-8')
                     # Add security headers
@@ -109,7 +114,7 @@ class FastTagsMiddleware:
                     return resp
                 return response
             except Exception as e:
-                logger.error(f"Error rendering FastTag: {e}")
+                logger.error("Error rendering FastTag: %s", e)
                 prescription = (
                     "1. Check your FastTag structure for errors.\n"
                     "2. Ensure all dependencies (e.g., html5lib) are installed if using validation.\n"
@@ -124,13 +129,52 @@ class FastTagsMiddleware:
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseServerError
 from django.middleware.csrf import get_token as get_csrf_token
-from django.utils.html import escape
-import re
+import functools
 import logging
 from fasttags import FT, to_xml, config  # Import FastTag class, renderer, and config
 
 logger = logging.getLogger(__name__)
 
+CSRF_FIELD = 'csrfmiddlewaretoken'
+
+def _inject_csrf(node, get_token):
+    """
+    Return the FT tree with a hidden CSRF input as the first child of every POST <form>.
+    The view's tree is never mutated: forms that need the input, and their ancestors, are
+    copied, so module-level or cached components can be shared across concurrent requests.
+    Works on the tree before serialization, so cost is O(nodes) rather than O(bytes).
+    `get_token()` is only called once a POST form is found, so other pages never touch
+    the CSRF cookie (or pick up its Vary: Cookie header). GET forms are left alone so the
+    token never ends up in a URL.
+    """
+    token = []  # Fetched lazily, at most once per tree
+
+    def visit(el):
+        el_type = type(el)
+        if el_type is list or el_type is tuple:
+            new = [visit(c) for c in el]
+            return el if all(a is b for a, b in zip(new, el)) else el_type(new)
+        if el_type is not FT:
+            return el
+        children = el.children
+        new_children = [visit(c) for c in children]
+        changed = any(a is not b for a, b in zip(new_children, children))
+        if el.tag == 'form' and str(el.attrs.get('method') or '').lower() == 'post':
+            if not token:
+                token.append(get_token())
+            first = new_children[0] if new_children else None
+            if type(first) is FT and first.tag == 'input' and first.attrs.get('name') == CSRF_FIELD:
+                new_children[0] = FT._make('input', first.children, {**first.attrs, 'value': token[0]},
+                                           first.void, first.validate_mode)
+            else:
+                new_children.insert(0, FT('input', void=True, type='hidden', name=CSRF_FIELD, value=token[0]))
+            changed = True
+        if not changed:
+            return el
+        return FT._make(el.tag, new_children, dict(el.attrs), el.void, el.validate_mode)
+
+    return visit(node)
+
 class FastTagsMiddleware:
     """
     Secure Django middleware for rendering FastTags in views.
@@ -138,7 +182,7 @@ class FastTagsMiddleware:
     Allows views to return FastTag objects for prototyping/small prod.
     Security features:
     - Opt-in for production via FASTTAGS_PROD_ENABLED setting.
-    - Auto-injects CSRF tokens into <form> tags.
+    - Auto-injects CSRF tokens into POST <form> tags.
     - Adds security headers (CSP, HSTS, etc.).
     - Enforces escaping and validation in prod.
     - Robust error handling with generic responses.
@@ -164,11 +208,12 @@ class FastTagsMiddleware:
         if not self.enabled:
             return None
 
+        @functools.wraps(view_func)
         def wrapped_view(request, *args, **kwargs):
             try:
                 response = view_func(request, *args, **kwargs)
-                if isinstance(response, FT):
-                    logger.info(f"Rendering FastTag from view: {view_func.__name__}")
+                if type(response) is FT:
+                    logger.info("Rendering FastTag from view: %s", view_func.__name__)
 
                     # Enforce security configs in prod
                     if not settings.DEBUG:
@@ -176,20 +221,19 @@ class FastTagsMiddleware:
                         config.enable_validation = True
                         config.validate_mode = config.validate_mode or 'static'  # Minimum validation
 
+                    # Auto-inject CSRF into POST forms at the tree level, on a copy, before rendering
+                    response = _inject_csrf(response, lambda: get_csrf_token(request))
+
                     # Render to HTML
                     html = to_xml(response, validate=config.enable_validation)
 
-                    # Auto-inject CSRF into forms (simple regex; improve if needed)
-                    csrf_token = get_csrf_token(request)
-                    html = re.sub(r'<form\b', f'<form method="post"><input type="hidden" name="csrfmiddlewaretoken" value="{escape(csrf_token)}"> <form', html, flags=re.IGNORECASE)
-
                     # Create response with security headers
                     resp = HttpResponse(html, content_type='text/html; charset=utf-8')
                     self.add_security_headers(resp)
                     return resp
                 return response
             except Exception as e:
-                logger.error(f"Error rendering FastTag: {e}", exc_info=True)
+                logger.error("Error rendering FastTag: %s", e, exc_info=True)
                 prescription = (
                     "1. Check your FastTag for errors (e.g., invalid attributes).\n"
                     "2. Ensure dependencies are installed if using advanced validation.\n"
@@ -10,14 +10,16 @@ Key Functions:
 """
 
 from typing import Any, Union, List, Tuple, Optional
+import importlib.util
+import logging
 import re
-from collections.abc import Iterable, Generator
-from functools import partial
+import threading
 from html import escape
-from .core import FastTag, Element, CurativeError, HTML_TAGS, ft
+from .core import FastTag, Element, CurativeError
+from .elements import FT, _VOID_LOWER
 from .utilities import flatten
 from .config import config
-from .validation import HTMLValidator
+from .validation import _VALIDATOR
 from .attributes import attrmap, keymap  # Reused for attribute mapping
 try:
     from bs4 import BeautifulSoup, Comment
@@ -30,13 +32,19 @@ except ModuleNotFoundError as e:
     ) from e
 
 # Simplified predicates (no NumPy/PyTorch support)
+# Concrete-type shortcuts; the ABC isinstance checks they replace go through __subclasshook__
+_NON_ITER = (str, bytes)
+_SIZED_TYPES = frozenset({list, tuple, dict, set, frozenset, str, bytes, bytearray})
+
 def is_iter(obj: Any) -> bool:
     """Check if obj is iterable (e.g., list, generator, but not str/bytes)."""
-    return isinstance(obj, (Iterable, Generator)) and not isinstance(obj, (str, bytes))
+    t = type(obj)  # Look on the type, as Iterable does, so classes themselves are not iterable
+    return getattr(t, '__iter__', None) is not None and not issubclass(t, _NON_ITER)
 
 def is_coll(obj: Any) -> bool:
     """Check if obj is a collection with a usable len() (e.g., list, tuple)."""
-    return hasattr(obj, '__len__')
+    t = type(obj)
+    return t in _SIZED_TYPES or hasattr(t, '__len__')
 
 # Unified conversion function (merges to_tuple, listify, tuplify for DRY)
 def normalize_coll(input_obj: Any, to_type: str = 'tuple', match_len: Optional[int] = None) -> Union[Tuple[Any, ...], List[Any]]:
@@ -65,15 +73,24 @@ def normalize_coll(input_obj: Any, to_type: str = 'tuple', match_len: Optional[i
         >>> normalize_coll(42, match_len=3)
         (42, 42, 42)
     """
-    match input_obj:
-        case None:
-            result = []
-        case str() | bytes():
-            result = [input_obj]
-        case _ if is_iter(input_obj):
-            result = list(flatten(input_obj))  # Reuse FastTags' flatten for DRY
-        case _:
-            raise TypeError(f"Unhandled type: {type(input_obj).__name__}. Supported: None, str/bytes, iterables.")
+    # Fast paths by exact type; only possibly-nested inputs go through match + flatten
+    t = type(input_obj)
+    if input_obj is None:
+        result = []
+    elif t is str or t is bytes:
+        result = [input_obj]
+    elif (t is tuple or t is list) and not any(map(is_iter, input_obj)):
+        if match_len is None and t is tuple and to_type == 'tuple':
+            return input_obj  # Already a flat tuple; immutable, so sharing it is safe
+        result = list(input_obj)
+    else:
+        match input_obj:
+            case str() | bytes():
+                result = [input_obj]
+            case _ if is_iter(input_obj):
+                result = list(flatten(input_obj))  # Reuse FastTags' flatten for DRY
+            case _:
+                raise TypeError(f"Unhandled type: {type(input_obj).__name__}. Supported: None, str/bytes, iterables.")
 
     if match_len is not None:
         if len(result) == 1:
@@ -105,11 +122,53 @@ def risinstance(types: Union[str, type, Tuple[Union[str, type], ...]], obj: Any
         return isinstance(o, types)
     return _check(obj) if obj is not None else _check
 
+# Parser backend, detected once at import: lxml (C) when available, else the pure-Python html.parser.
+# lxml wraps fragments in an implied <html><body>, so it is only used for whole documents.
+_HAS_LXML = importlib.util.find_spec('lxml') is not None
+_DOCUMENT_PARSER = 'lxml' if _HAS_LXML else 'html.parser'
+
+def _is_document(html: str) -> bool:
+    """True if the input brings its own <html> root (optionally after a doctype/comments)."""
+    return '<html' in html[:1024].lower()
+
+def _has_svg(html: str) -> bool:
+    """Fixed-string SVG pre-check; the lowercase probe handles mixed-case markup."""
+    return '<svg' in html or '<svg' in html.lower()
+
+# One bs4 tree builder per parser feature, reused across calls. Builders hold the soup
+# being built, so the cache is per thread.
+_BUILDERS = threading.local()
+
+def _get_builder(features: str):
+    cache = _BUILDERS.__dict__
+    builder = cache.get(features)
+    if builder is None:
+        from bs4.builder import builder_registry
+        builder_cls = builder_registry.lookup(features)
+        if builder_cls is None:
+            raise CurativeError(f"No BeautifulSoup tree builder for '{features}'.",
+                                f"1. Install the parser backing '{features}' (e.g. pip install lxml html5lib).\n2. Rerun conversion.")
+        builder = cache[features] = builder_cls()
+    return builder
+
 # Regex for valid attribute keys
-_re_h2x_attr_key = re.compile(r'^[A-Za-z_-][\w-]*$')
+_re_h2x_attr_key = re.compile(r'[A-Za-z_-][\w-]*')
+
+def _is_kwarg_key(key: str) -> bool:
+    """True if key can be emitted as a keyword argument (after hyphen -> underscore)."""
+    if key.isascii():  # Equivalent to the regex on ASCII, without regex dispatch
+        return key.translate(_UNDERSCORE_TRANS).isidentifier()
+    return _re_h2x_attr_key.fullmatch(key) is not None
+
+# Hyphen -> underscore for Python keyword arguments
+_UNDERSCORE_TRANS = str.maketrans('-', '_')
+
+# Indent strings by nesting level for html2ft output (default 4-space width)
+_INDENT_WIDTH = 4
+_INDENTS = [" " * (_INDENT_WIDTH * i) for i in range(32)]
 
 # Unsafe tags for warnings (common injection vectors)
-_UNSAFE_TAGS = {'script', 'iframe', 'object', 'embed', 'link'}  # link for rel="import"
+_UNSAFE_TAGS = frozenset({'script', 'iframe', 'object', 'embed', 'link'})  # link for rel="import"
 
 def html2ft(html: Union[str, bytes], attr1st: bool = False, validate: Optional[bool] = None, 
             heal_parsing: Optional[bool] = None, strict: str = 'warn', 
@@ -160,19 +219,17 @@ def html2ft(html: Union[str, bytes], attr1st: bool = False, validate: Optional[b
 
     soup = None
     try:
-        # Auto-detect SVG for parser mode switch (if lxml available)
-        parser_features = 'html.parser'
-        try:
-            import lxml  # Optional
-            if re.search(r'<svg', html, re.I):  # Simple pre-check for SVG
+        # Auto-detect SVG for parser mode switch (XML mode needs lxml)
+        parser_features = _DOCUMENT_PARSER if _is_document(html) else 'html.parser'
+        if _has_svg(html):  # Simple pre-check for SVG
+            if _HAS_LXML:
                 parser_features = 'lxml-xml'  # XML mode for case/namespace preservation
-        except ImportError:
-            if re.search(r'<svg', html, re.I):
+            else:
                 logging.warning("SVG detected but lxml not installed; using html.parser (case/namespaces may not preserve perfectly).")
                 if strict == 'raise':
                     raise CurativeError("lxml required for optimal SVG handling.", "1. Install lxml: pip install lxml\n2. Rerun conversion.")
 
-        soup = BeautifulSoup(html.strip(), parser_features)
+        soup = BeautifulSoup(html.strip(), builder=_get_builder(parser_features))
     except Exception as bs_error:
         if effective_heal:
             logging.warning(f"Parsing failed: {bs_error}. Attempting curative fallback.")
@@ -192,37 +249,50 @@ def html2ft(html: Union[str, bytes], attr1st: bool = False, validate: Optional[b
         else:
             return None if return_obj else '()'
 
-    # Remove comments
-    for c in soup.find_all(string=risinstance(Comment)):
-        c.extract()
+    # Remove comments and collect unsafe tags in a single pass over the tree
+    found_unsafe = set()
+    for node in list(soup.descendants):  # Snapshot: extract() mutates the tree
+        if isinstance(node, Comment):
+            node.extract()
+        elif node.name in _UNSAFE_TAGS:
+            found_unsafe.add(node.name)
 
     # Warn on unsafe tags if not quiet
-    if not quiet_unsafe:
-        for tag in _UNSAFE_TAGS:
-            if soup.find(tag):
-                logging.warning(f"Unsafe tag '{tag}' detected in HTML; potential security risk if output is rendered dynamically.")
+    if found_unsafe and not quiet_unsafe:
+        for tag in sorted(found_unsafe):
+            logging.warning(f"Unsafe tag '{tag}' detected in HTML; potential security risk if output is rendered dynamically.")
 
     # Internal parsing helpers
     def _parse_children(cts: list, lvl: int, raw_embedded: bool) -> list[str]:
         """Parse children recursively, with optional escaping."""
-        def process_content(c):
-            if isinstance(c, str) and c.strip():
-                return repr(escape(c.strip()) if not raw_embedded else c.strip())
-            return _parse_element(c, lvl + 1, raw_embedded)
-        return [process_content(c) for c in cts if str(c).strip()]
+        _escape, _repr = escape, repr
+        out = []
+        append = out.append
+        for c in cts:
+            if isinstance(c, str):  # Strip once; Tags are always kept (no str(tag) re-render)
+                text = c.strip()
+                if text:
+                    append(_repr(text if raw_embedded else _escape(text)))
+            else:
+                append(_parse_element(c, lvl + 1, raw_embedded=raw_embedded))
+        return out
 
     def _parse_attrs(elm_attrs: dict) -> list[str]:
         """Parse and map attributes using FastTags' attrmap/keymap for DRY."""
         mapped_attrs = attrmap(elm_attrs)  # Reuse FastTags' attrmap
         attrs, exotic_attrs = [], {}
-        for key, value in sorted(mapped_attrs.items(), key=lambda x: x[0] == 'class'):
+        # Stable partition: 'class' goes last, everything else keeps source order
+        items = [kv for kv in mapped_attrs.items() if kv[0] != 'class']
+        if 'class' in mapped_attrs:
+            items.append(('class', mapped_attrs['class']))
+        for key, value in items:
             if isinstance(value, (tuple, list)):
                 value = " ".join(value)
             # Use keymap for any additional mapping if needed (DRY)
             key = keymap(key)
             value = value or True
-            if _re_h2x_attr_key.match(key):
-                attrs.append(f'{key.replace("-", "_")}={value!r}')  # Underscore for Python
+            if _is_kwarg_key(key):
+                attrs.append(f'{key.translate(_UNDERSCORE_TRANS)}={value!r}')  # Underscore for Python
             else:
                 exotic_attrs[key] = value
         if exotic_attrs:
@@ -232,18 +302,24 @@ def html2ft(html: Union[str, bytes], attr1st: bool = False, validate: Optional[b
     def _parse_element(elm, lvl: int, indent: int = 4, raw_embedded: bool = False) -> str:
         """Parse a single element recursively."""
         if isinstance(elm, str):
-            return repr(escape(elm.strip()) if not raw_embedded else elm.strip()) if elm.strip() else ''
+            text = elm.strip()
+            return repr(text if raw_embedded else escape(text)) if text else ''
         if isinstance(elm, list):
-            return '\n'.join(_parse_element(o, lvl, raw_embedded) for o in elm)
+            return '\n'.join(_parse_element(o, lvl, raw_embedded=raw_embedded) for o in elm)
         if elm.name == '[document]':
-            return _parse_element(list(elm.children), lvl, raw_embedded)
+            return _parse_element(list(elm.children), lvl, raw_embedded=raw_embedded)
 
         tag_name = elm.name.capitalize().replace("-", "_")  # Pythonic tag name
         cts = elm.contents
         cs = _parse_children(cts, lvl, raw_embedded)
         attrs = _parse_attrs(elm.attrs)
 
-        spc = " " * lvl * indent
+        if indent == _INDENT_WIDTH:
+            while lvl >= len(_INDENTS):  # Grow lazily for unusually deep documents
+                _INDENTS.append(_INDENTS[-1] + _INDENTS[1])
+            spc, prev = _INDENTS[lvl], _INDENTS[lvl - 1]
+        else:
+            spc, prev = " " * lvl * indent, " " * (lvl - 1) * indent
         onlychild = not cts or (len(cts) == 1 and isinstance(cts[0], str))
         j = ', ' if onlychild else f',\n{spc}'
 
@@ -255,31 +331,18 @@ def html2ft(html: Union[str, bytes], attr1st: bool = False, validate: Optional[b
                 attrs_str = ', '.join(filter(None, attrs))
                 return f'{tag_name}({attrs_str})({cs[0] if cs else ""})'
         if not attr1st or not attrs:
-            return f'{tag_name}(\n{spc}{inner}\n{" " * (lvl - 1) * indent})'
+            return f'{tag_name}(\n{spc}{inner}\n{prev})'
         inner_cs = j.join(filter(None, cs))
         inner_attrs = ', '.join(filter(None, attrs))
-        return f'{tag_name}({inner_attrs})(\n{spc}{inner_cs}\n{" " * (lvl - 1) * indent})'
-
-    # Parse to list of expressions (for multi-root support)
-    parsed_exprs = [_parse_element(child, 1, raw_embedded) for child in soup.children if str(child).strip()]
-
-    if not parsed_exprs:
-        return None if return_obj else '()'
-
-    result_str = f"({' , '.join(parsed_exprs)})" if len(parsed_exprs) > 1 else parsed_exprs[0]
-
-    # Add warnings as prefixed comments if strict='warn'
-    if strict == 'warn' and not quiet_unsafe:
-        warning_comment = "# WARNING: Unsafe tags detected (e.g., script/iframe); review for security.\n"
-        result_str = warning_comment + result_str
+        return f'{tag_name}({inner_attrs})(\n{spc}{inner_cs}\n{prev})'
 
     if return_obj:
         try:
-            # Safely eval to list of FT objects (restricted globals)
-            result_list = eval(f"[{', '.join(parsed_exprs)}]", {"__builtins__": {}}, {"ft": ft, **{t: partial(ft, t.lower()) for t in HTML_TAGS}})
+            # Build FT objects straight from the soup; no source string to compile and eval
+            result_list = [_build_obj(child, raw_embedded) for child in soup.children
+                           if not isinstance(child, str) or child.strip()]
             if validate or (validate is None and config.enable_validation):
-                validator = HTMLValidator()
-                result_list = [validator.validate_and_heal(el, config.validate_mode) for el in result_list if el]
+                result_list = [_VALIDATOR.validate_and_heal(el, config.validate_mode) for el in result_list if el]
 
             if not result_list:
                 return None
@@ -289,22 +352,44 @@ def html2ft(html: Union[str, bytes], attr1st: bool = False, validate: Optional[b
                 return tuple(result_list)  # Multi-root tuple
         except Exception as e:
             if strict == 'raise':
-                raise CurativeError(f"Failed to convert to FT object: {e}", "1. Check generated expression for syntax.\n2. Ensure valid HTML input.\n3. Disable return_obj and inspect string output.") from e
+                raise CurativeError(f"Failed to convert to FT object: {e}", "1. Ensure valid HTML input.\n2. Disable return_obj and inspect string output.") from e
             elif strict == 'warn':
-                return f"# WARNING: Eval failed; returning empty.\n()"
+                return f"# WARNING: Conversion failed; returning empty.\n()"
             else:
                 return None
-    else:
-        return result_str
+
+    # Parse to list of expressions (for multi-root support)
+    parsed_exprs = [_parse_element(child, 1, raw_embedded=raw_embedded) for child in soup.children
+                    if not isinstance(child, str) or child.strip()]
+
+    if not parsed_exprs:
+        return '()'
+
+    result_str = f"({' , '.join(parsed_exprs)})" if len(parsed_exprs) > 1 else parsed_exprs[0]
+
+    # Add warnings as prefixed comments if strict='warn'
+    if strict == 'warn' and not quiet_unsafe:
+        warning_comment = "# WARNING: Unsafe tags detected (e.g., script/iframe); review for security.\n"
+        result_str = warning_comment + result_str
+
+    return result_str
+
+def _build_obj(elm, raw_embedded: bool = False) -> Union[FastTag, str]:
+    """Object counterpart of html2ft's string emitter: soup node -> FT (or text)."""
+    if isinstance(elm, str):
+        text = elm.strip()
+        return text if raw_embedded else escape(text)
+    children = [_build_obj(c, raw_embedded) for c in elm.contents if not isinstance(c, str) or c.strip()]
+    attrs = {k: (" ".join(v) if isinstance(v, (tuple, list)) else v) or True for k, v in elm.attrs.items()}
+    # soup keys are already in HTML form; passed as a dict so names like 'tag'/'void' can't clash with FT's parameters
+    return FT(elm.name, *children, void=elm.name.lower() in _VOID_LOWER, _raw_attrs=attrs)
 
 def _curative_fallback_parse(html: str) -> Optional[BeautifulSoup]:
     """Curative fallback parser using FastTags' validation modes if BeautifulSoup fails."""
     # Always try html5lib first (per spec)
     try:
-        import html5lib
-        parser = html5lib.HTMLParser()
-        document = parser.parse(html)
-        return BeautifulSoup(document.toxml(), 'html.parser')
+        import html5lib  # noqa: F401 -- presence check; bs4 drives the parser itself
+        return BeautifulSoup(html, builder=_get_builder('html5lib'))  # Single pass: html5lib builds the bs4 tree directly
     except ModuleNotFoundError:
         logging.warning("html5lib not installed; skipping to next fallback.")
     except Exception as e:
@@ -331,7 +416,7 @@ def _curative_fallback_parse(html: str) -> Optional[BeautifulSoup]:
                         "3. Switch to a different validate_mode for tolerant parsing."
                     )
                 # If no errors, retry BeautifulSoup
-                return BeautifulSoup(html.strip(), 'html.parser')
+                return BeautifulSoup(html.strip(), builder=_get_builder('html.parser'))
             return None
         except Exception as e:
             logging.error(f"W3C fallback failed: {e}")
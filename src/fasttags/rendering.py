@@ -1,66 +1,144 @@
 from html import escape as html_escape
 from collections.abc import Iterable, Mapping
-from typing import Generator
+from functools import lru_cache, partial
 import logging
-from .core import FastTag, SafeHtml, Element, CurativeError
+from .core import FastTag, SafeHtml, Element, CurativeError, HTML_TAGS
 from .utilities import as_json
 from .attributes import to_attr
 from .config import config
-from .validation import HTMLValidator
+from .validation import _VALIDATOR
 
-def _to_xml(el: Element, escape=html_escape) -> Generator[str, None, None]:
-    try:
-        match el:
-            case FastTag():
-                tag = el.tag
-                yield f'<{tag}'
+class _Close(str):
+    """Closing-tag marker pushed on the render stack; emitted verbatim."""
+    __slots__ = ()
+
+# Per-tag (open, close) strings, pre-built for the HTML5 set and grown on first use
+_TAG_CACHE: dict[str, tuple[str, '_Close']] = {}
+
+def _tag_parts(tag: str) -> tuple[str, '_Close']:
+    parts = _TAG_CACHE.get(tag)
+    if parts is None:
+        parts = _TAG_CACHE.setdefault(tag, (f'<{tag}', _Close(f'</{tag}>')))
+    return parts
+
+for _t in HTML_TAGS:
+    _tag_parts(_t.lower())
+del _t
+
+# String attribute values repeat heavily (class/id/type); other types may be unhashable or mutable
+_str_attr = lru_cache(maxsize=4096)(to_attr)
+
+def _attrs_str(attrs: dict) -> str:
+    """Space-prefixed attribute string ('' if every attribute renders empty)."""
+    kvs = [s for k, v in attrs.items() if (s := _str_attr(k, v) if type(v) is str else to_attr(k, v))]
+    return ' ' + ' '.join(kvs) if kvs else ''
+
+# Node kinds; classified once per concrete type because Protocol/ABC isinstance checks are slow
+_K_TAG, _K_SAFE, _K_STR, _K_BYTES, _K_MAP, _K_ITER, _K_OTHER, _K_CLOSE = range(8)
+_KIND_CACHE: dict[type, int] = {
+    str: _K_STR, bytes: _K_BYTES, list: _K_ITER, tuple: _K_ITER, dict: _K_MAP, _Close: _K_CLOSE,
+}
+
+def _classify(el: Element) -> int:
+    """Slow path for types not yet seen; the result is cached by type(el)."""
+    match el:
+        case FastTag():
+            kind = _K_TAG
+        case SafeHtml():
+            kind = _K_SAFE
+        case str():
+            kind = _K_STR
+        case bytes():
+            kind = _K_BYTES
+        case Mapping():
+            kind = _K_MAP
+        case Iterable():
+            kind = _K_ITER
+        case _:
+            kind = _K_OTHER
+    _KIND_CACHE[type(el)] = kind
+    return kind
+
+def _emit(root: Element, append, escape=html_escape, heal=None) -> None:
+    """
+    Render root into append() with an explicit stack instead of recursive generators.
+    If heal is given, each tag is validated/healed just before it is emitted (one pass).
+    """
+    if not config.escape_by_default:
+        escape = str  # Read the setting once per render, not per text node
+    kinds = _KIND_CACHE
+    stack = [root]
+    pop, push = stack.pop, stack.append
+    while stack:
+        el = pop()
+        kind = kinds.get(type(el))
+        if kind is None:
+            kind = _classify(el)
+        if kind == _K_CLOSE:
+            append(el)
+            continue
+        try:
+            if kind == _K_TAG:
+                if heal is not None and heal(el) is None:
+                    continue  # Dropped by healing
+                opener, closer = _tag_parts(el.tag)
                 attrs = el.attrs
-                if attrs:
-                    yield ' '
-                    yield ' '.join(filter(None, (to_attr(k, v) for k, v in attrs.items())))
                 if el.void:
-                    yield ' />'
-                else:
-                    yield '>'
-                    for child in el.children:
-                        yield from _to_xml(child, escape)
-                    yield f'</{tag}>'
-            case SafeHtml():
-                yield el.__html__()
-            case str():
-                yield escape(el) if config.escape_by_default else el
-            case bytes():
-                yield el.decode('utf-8')
-            case Mapping():
-                yield as_json(el)
-            case Iterable():
-                for item in el:
-                    yield from _to_xml(item, escape)
-            case _:
-                yield escape(str(el)) if config.escape_by_default else str(el)
-    except Exception as e:
-        logging.error(f"Rendering error: {e}")
-        if config.auto_heal:
-            logging.info("Healing: Skipping unrenderable element.")
-            return  # Skip and continue
-        else:
+                    append(f'{opener}{_attrs_str(attrs)} />' if attrs else f'{opener} />')
+                    continue
+                append(f'{opener}{_attrs_str(attrs)}>' if attrs else f'{opener}>')
+                push(closer)
+                stack.extend(reversed(el.children))
+            elif kind == _K_STR:
+                append(escape(el))
+            elif kind == _K_ITER:
+                stack.extend(reversed(el if type(el) is list else list(el)))
+            elif kind == _K_SAFE:
+                append(el.__html__())
+            elif kind == _K_BYTES:
+                append(el.decode('utf-8'))
+            elif kind == _K_MAP:
+                append(as_json(el))
+            else:
+                append(escape(str(el)))
+        except Exception as e:
+            logging.error(f"Rendering error: {e}")
+            if config.auto_heal:
+                logging.info("Healing: Skipping unrenderable element.")
+                continue  # Skip and continue
             raise
 
+def _to_xml(el: Element, escape=html_escape, heal=None) -> str:
+    parts = []
+    _emit(el, parts.append, escape, heal)
+    return ''.join(parts)
+
+def _healer(el: Element):
+    mode = getattr(el, 'validate_mode', config.validate_mode)  # Use per-element or global
+    return None if mode == 'none' else partial(_VALIDATOR.heal_node, mode=mode)
+
 def to_xml(*contents: Element, escape=html_escape, newline='\n', validate: bool = False) -> str:
-    validator = HTMLValidator()
-    processed = contents
+    # Tokens of one element are joined tightly; newline only separates top-level contents
     if validate:
-        processed = []
-        for el in contents:
-            mode = getattr(el, 'validate_mode', config.validate_mode)  # Use per-element or global
-            healed = validator.validate_and_heal(el, mode)
-            if healed is not None:
-                processed.append(healed)
+        return newline.join([_to_xml(content, escape, _healer(content)) for content in contents])
+    return newline.join([_to_xml(content, escape) for content in contents])
 
-    parts = []
-    for content in processed:
-        parts.extend(_to_xml(content, escape))
-    return newline.join(parts)
+def to_xml_bytes(*contents: Element, escape=html_escape, newline=b'\n', validate: bool = False) -> bytes:
+    """
+    Render straight to UTF-8 bytes (e.g. for HttpResponse). Tokens are encoded into one
+    bytearray as they are emitted, so no full-document str is built and then encoded.
+    """
+    buf = bytearray()
+    extend = buf.extend
+
+    def append(token: str) -> None:
+        extend(token.encode('utf-8'))
+
+    for i, content in enumerate(contents):
+        if i:
+            extend(newline)
+        _emit(content, append, escape, _healer(content) if validate else None)
+    return bytes(buf)
 
 to_html = to_xml  # Alias
 
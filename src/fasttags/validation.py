@@ -1,15 +1,15 @@
 import warnings
 import logging
 import difflib  # Built-in for fuzzy matching
+from functools import lru_cache
 from .core import FastTag, Element, HTML_TAGS, VOID_ELEMENTS, CurativeError
 from .config import config
-from .rendering import to_xml  # For dynamic validation rendering
 
 # Global attributes allowed on all elements
-GLOBAL_ATTRS = {
+GLOBAL_ATTRS = frozenset({
     'accesskey', 'class', 'contenteditable', 'dir', 'draggable', 'hidden', 'id',
     'lang', 'spellcheck', 'style', 'tabindex', 'title', 'translate'
-}
+})
 
 # Expanded static allowlist (from MDN/WHATWG; add more as needed)
 VALID_ATTRS = {
@@ -22,6 +22,9 @@ VALID_ATTRS = {
     # Expand with more tags
 }
 
+# Per-tag allowlists with the globals folded in, so a static check is one membership test
+_ALLOWED = {tag: frozenset(attrs) | GLOBAL_ATTRS for tag, attrs in VALID_ATTRS.items()}
+
 def warn_void_override(tag: str, user_void: bool, expected_void: bool):
     if user_void != expected_void:
         warnings.warn(
@@ -31,104 +34,150 @@ def warn_void_override(tag: str, user_void: bool, expected_void: bool):
         )
 
 class HTMLValidator:
-    def validate_and_heal(self, el: Element, mode: str = 'none') -> Element:
-        """Validate and optionally heal based on mode: 'none', 'static', 'html5lib', 'w3c'."""
+    """Stateless validator; share the module-level _VALIDATOR instead of constructing one per call."""
+    __slots__ = ()
+
+    def validate_and_heal(self, el: Element, mode: str = 'none',
+                          _seen: dict[int, Element | None] | None = None) -> Element:
+        """
+        Validate and optionally heal based on mode: 'none', 'static', 'html5lib', 'w3c'.
+        Subtrees shared within the tree (reused partials) are healed once; _seen maps id(node) to its result.
+        """
         if mode == 'none':
             return el
 
         match el:
             case FastTag():
-                # Check invalid tag
-                if el.tag.title() not in HTML_TAGS:
-                    logging.warning(f"Invalid tag '{el.tag}' detected.")
-                    if config.auto_heal:
-                        logging.info(f"Healing: Dropping invalid tag '{el.tag}'.")
-                        return None
-
-                # Mode-specific attribute validation with fuzzy healing
-                valid_attrs = {}
-                for k, v in list(el.attrs.items()):  # Copy to avoid modification during iteration
-                    if self.is_valid_attr(k, el.tag, mode):
-                        valid_attrs[k] = v
-                    else:
-                        if config.auto_heal:
-                            healed_key = self.fuzzy_heal_attr(k, el.tag, mode)
-                            if healed_key:
-                                valid_attrs[healed_key] = v
-                                logging.info(f"Healing: Replaced '{k}' with fuzzy match '{healed_key}' in '{el.tag}'.")
-                            else:
-                                logging.info(f"Healing: Dropped invalid attribute '{k}' from '{el.tag}'.")
-                        else:
-                            logging.warning(f"Invalid attribute '{k}' in '{el.tag}'.")
-
-                el.attrs = valid_attrs
-
-                # Recurse on children
-                healed_children = [self.validate_and_heal(child, mode) for child in el.children if child is not None]
-                el.children = healed_children
+                if _seen is None:
+                    _seen = {}  # Root call; el keeps every node alive, so ids stay valid
+                else:
+                    key = id(el)
+                    if key in _seen:
+                        return _seen[key]
+                if self.heal_node(el, mode) is None:
+                    _seen[id(el)] = None
+                    return None
+
+                # Recurse on children, dropping any that healing removed
+                healed_children = [self.validate_and_heal(child, mode, _seen) for child in el.children if child is not None]
+                el.children = [child for child in healed_children if child is not None]
 
+                _seen[id(el)] = el
                 return el
 
             case _:
                 return el
 
+    def heal_node(self, el: FastTag, mode: str) -> FastTag | None:
+        """Validate/heal a single tag and its attributes without descending into children."""
+        # Check invalid tag
+        if el.tag.title() not in HTML_TAGS:
+            logging.warning(f"Invalid tag '{el.tag}' detected.")
+            if config.auto_heal:
+                logging.info(f"Healing: Dropping invalid tag '{el.tag}'.")
+                return None
+
+        # Mode-specific attribute validation with fuzzy healing
+        valid_attrs = {}
+        for k, v in list(el.attrs.items()):  # Copy to avoid modification during iteration
+            if self.is_valid_attr(k, el.tag, mode):
+                valid_attrs[k] = v
+            else:
+                if config.auto_heal:
+                    healed_key = self.fuzzy_heal_attr(k, el.tag, mode)
+                    if healed_key:
+                        valid_attrs[healed_key] = v
+                        logging.info(f"Healing: Replaced '{k}' with fuzzy match '{healed_key}' in '{el.tag}'.")
+                    else:
+                        logging.info(f"Healing: Dropped invalid attribute '{k}' from '{el.tag}'.")
+                else:
+                    logging.warning(f"Invalid attribute '{k}' in '{el.tag}'.")
+
+        el.attrs = valid_attrs
+        return el
+
     def is_valid_attr(self, attr: str, tag: str, mode: str) -> bool:
-        if attr.startswith('data-') or attr in GLOBAL_ATTRS:
+        if attr[:5] == 'data-':  # Slice compare: no method dispatch
             return True
 
         if mode == 'static':
-            return tag in VALID_ATTRS and attr in VALID_ATTRS[tag]
+            return attr in _ALLOWED.get(tag, GLOBAL_ATTRS)  # Globals already folded in
 
-        if mode == 'html5lib':
-            try:
-                import html5lib
-                # Render minimal test HTML and parse strictly
-                test_html = f'<{tag} {attr}="test"></{tag}>' if tag not in VOID_ELEMENTS else f'<{tag} {attr}="test">'
-                parser = html5lib.HTMLParser(strict=True)
-                parser.parseFragment(test_html)
-                return True
-            except ModuleNotFoundError:
-                prescription = (
-                    "1. Install html5lib: pip install html5lib\n"
-                    "2. Restart your Python environment.\n"
-                    "3. Alternatively, switch to 'static' mode or set config.auto_heal=True for fallback."
-                )
-                if config.auto_heal:
-                    logging.warning("Healing: Falling back to static validation due to missing html5lib.")
-                    return self.is_valid_attr(attr, tag, 'static')
-                else:
-                    raise CurativeError("Missing module: html5lib for 'html5lib' validation mode.", prescription)
-            except html5lib.html5parser.ParseError:
-                return False
+        if attr in GLOBAL_ATTRS:  # Early-out before the expensive checks
+            return True
 
-        if mode == 'w3c':
+        if mode == 'html5lib' or mode == 'w3c':
             try:
-                import requests
-                # Render minimal test HTML
-                test_html = f'<{tag} {attr}="test"></{tag}>' if tag not in VOID_ELEMENTS else f'<{tag} {attr}="test">'
-                url = "https://validator.w3.org/nu/"
-                params = {"out": "json"}
-                headers = {"Content-Type": "text/html; charset=utf-8"}
-                response = requests.post(url, params=params, data=test_html.encode('utf-8'), headers=headers)
-                if response.status_code == 200:
-                    results = response.json()
-                    errors = [msg for msg in results.get('messages', []) if msg['type'] == 'error']
-                    return not errors  # Valid if no errors
-                return False
-            except ModuleNotFoundError:
-                prescription = (
-                    "1. Install requests: pip install requests\n"
-                    "2. Restart your Python environment.\n"
-                    "3. Alternatively, switch to 'static' or 'html5lib' mode or set config.auto_heal=True for fallback.\n"
-                    "See https://validator.w3.org/docs/api.html for more info."
-                )
-                if config.auto_heal:
-                    logging.warning("Healing: Falling back to static validation due to missing requests.")
-                    return self.is_valid_attr(attr, tag, 'static')
-                else:
-                    raise CurativeError("Missing module: requests for 'w3c' validation mode.", prescription)
-            except Exception as e:
-                logging.error(f"W3C validation error: {e}")
-                return True  # Assume valid on failure to avoid false negatives
+                return _is_valid_attr_cached(attr, tag, mode)
+            except _Uncached as u:  # Provisional answer: use it, but ask again next time
+                return u.result
 
         return True  # Default to allow if mode invalid
+
+class _Uncached(Exception):
+    """Carries a provisional result out of `_is_valid_attr_cached` without caching it."""
+    def __init__(self, result: bool):
+        self.result = result
+
+# Only definitive answers are cached: a real html5lib parse or a 200 from the validator.
+# Fallbacks (auto_heal, non-200, network errors) escape via _Uncached; lru_cache never caches a raise.
+@lru_cache(maxsize=8192)
+def _is_valid_attr_cached(attr: str, tag: str, mode: str) -> bool:
+    if mode == 'html5lib':
+        try:
+            import html5lib
+            # Render minimal test HTML and parse strictly
+            test_html = f'<{tag} {attr}="test"></{tag}>' if tag not in VOID_ELEMENTS else f'<{tag} {attr}="test">'
+            parser = html5lib.HTMLParser(strict=True)
+            parser.parseFragment(test_html)
+            return True
+        except ModuleNotFoundError:
+            prescription = (
+                "1. Install html5lib: pip install html5lib\n"
+                "2. Restart your Python environment.\n"
+                "3. Alternatively, switch to 'static' mode or set config.auto_heal=True for fallback."
+            )
+            if config.auto_heal:
+                logging.warning("Healing: Falling back to static validation due to missing html5lib.")
+                raise _Uncached(attr in _ALLOWED.get(tag, GLOBAL_ATTRS))
+            else:
+                raise CurativeError("Missing module: html5lib for 'html5lib' validation mode.", prescription)
+        except html5lib.html5parser.ParseError:
+            return False
+
+    if mode == 'w3c':
+        try:
+            import requests
+            # Render minimal test HTML
+            test_html = f'<{tag} {attr}="test"></{tag}>' if tag not in VOID_ELEMENTS else f'<{tag} {attr}="test">'
+            url = "https://validator.w3.org/nu/"
+            params = {"out": "json"}
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            response = requests.post(url, params=params, data=test_html.encode('utf-8'), headers=headers)
+            if response.status_code == 200:
+                results = response.json()
+                errors = [msg for msg in results.get('messages', []) if msg['type'] == 'error']
+                return not errors  # Valid if no errors
+            raise _Uncached(False)
+        except ModuleNotFoundError:
+            prescription = (
+                "1. Install requests: pip install requests\n"
+                "2. Restart your Python environment.\n"
+                "3. Alternatively, switch to 'static' or 'html5lib' mode or set config.auto_heal=True for fallback.\n"
+                "See https://validator.w3.org/docs/api.html for more info."
+            )
+            if config.auto_heal:
+                logging.warning("Healing: Falling back to static validation due to missing requests.")
+                raise _Uncached(attr in _ALLOWED.get(tag, GLOBAL_ATTRS))
+            else:
+                raise CurativeError("Missing module: requests for 'w3c' validation mode.", prescription)
+        except _Uncached:
+            raise
+        except Exception as e:
+            logging.error(f"W3C validation error: {e}")
+            raise _Uncached(True)  # Assume valid on failure to avoid false negatives
+
+    return True  # Default to allow if mode invalid
+
+# Shared instance for rendering and parsing (HTMLValidator holds no state)
+_VALIDATOR = HTMLValidator()
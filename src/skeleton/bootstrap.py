@@ -2,7 +2,10 @@ import subprocess
 import os
 import sys
 import platform
-import os.path  # For path checks
+import re
+import shutil
+import tempfile
+from pathlib import Path
 
 # Detect the platform and set paths accordingly
 os_type = platform.system()
@@ -11,16 +14,28 @@ if os_type == 'Windows':
 else:  # macOS, Linux, WSL
     venv_python = '.venv/bin/python'
 
+# Pattern for adding the app to INSTALLED_APPS in settings.py (Step 7)
+INSTALLED_APPS_RE = re.compile(r'(INSTALLED_APPS\s*=\s*\[[^\]]*)\]')
+
+# Patterns for patching the project's urls.py (Step 10)
+URLPATTERNS_RE = re.compile(r'^urlpatterns\s*=\s*\[', re.M)
+INCLUDE_IMPORT_RE = re.compile(r'^from django\.urls import .*\binclude\b', re.M)
+IMPORT_LINE_RE = re.compile(r'^(?:from|import)\s.*$', re.M)
+
 # Function to run shell commands and check for errors with better logging and feedback
-def run_command(command, check=True):
+# capture=False discards stdout (nothing is buffered or decoded); stderr is always kept for error reports
+def run_command(command, check=True, capture=False):
     print(f"Running command: {command}")  # Show the command being run
     try:
-        result = subprocess.run(command, shell=False, check=check, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout = subprocess.PIPE if capture else subprocess.DEVNULL
+        # Exit status is handled below, after stderr has been printed
+        result = subprocess.run(command, shell=False, stdout=stdout, stderr=subprocess.PIPE)
         
         # Print stdout
-        stdout_content = result.stdout.decode().strip()
-        if stdout_content:
-            print(f"stdout: {stdout_content}")
+        if capture:
+            stdout_content = result.stdout.decode().strip()
+            if stdout_content:
+                print(f"stdout: {stdout_content}")
         
         # Print stderr
         stderr_content = result.stderr.decode().strip()
@@ -47,115 +62,95 @@ if os.path.exists("pyproject.toml"):
 else:
     run_command(["uv", "init"])
 
-# Step 2: Create the virtual environment using UV
-print("Creating virtual environment...")
-run_command(["uv", "venv", ".venv"])
-
-# Pre-check: Ensure the virtual environment was created
-if not os.path.exists(venv_python):
-    print(f"Error: Virtual environment Python executable not found at {venv_python}. Please check creation.")
-    sys.exit(1)
+# Steps 2-3: Add Django, fastcore (Fast Tag support) and fastlite (Mini Data Spec support) in one
+# lockfile-driven resolve; `uv add` also creates .venv and syncs it, so no separate `uv venv` run.
+# Exits on failure, so no follow-up stat of venv_python is needed.
+print("Creating virtual environment and adding Django, fastcore and fastlite using UV...")
+run_command(["uv", "add", "django", "fastcore", "fastlite"])
 
-# Step 3: Add Django using UV
-print("Adding Django to the project using UV...")
-run_command(["uv", "add", "django"])
+# The environment is synced by `uv add`; call its interpreter directly rather than paying for a
+# `uv run` sync check on each Django command. Absolute, since Step 5 changes directory.
+venv_python = os.path.abspath(venv_python)
 
-# Step 4: Create the Django project using uv run
-print("Creating Django project using uv run...")
-run_command(["uv", "run", "django-admin", "startproject", "xtremeadmin"])  # Updated command
+# Step 4: Create the Django project with the venv's Python
+print("Creating Django project...")
+run_command([venv_python, "-m", "django", "startproject", "xtremeadmin"])
 
 # Step 5: Change into the project directory
 os.chdir("xtremeadmin")
 
-# Step 6: Create the Django app using uv run
-print("Creating Django app using uv run...")
-run_command(["uv", "run", "manage.py", "startapp", "xtreme_admin"])  # Updated command
+# Step 6: Create the Django app with the venv's Python
+print("Creating Django app...")
+run_command([venv_python, "manage.py", "startapp", "xtreme_admin"])
 
 # Step 7: Modify settings.py to add the app to INSTALLED_APPS
+# One regex splice adds the app before the closing bracket; the temp file + os.replace keeps the swap atomic
 settings_path = "xtremeadmin/settings.py"
-with open(settings_path, "r") as f:
-    lines = f.readlines()
-
-with open(settings_path, "w") as f:
-    in_installed_apps = False
-    for line in lines:
-        if line.strip().startswith("INSTALLED_APPS = ["):
-            in_installed_apps = True
-            f.write(line)
-        elif in_installed_apps and line.strip() == "]":
-            f.write("    'xtreme_admin',\n")  # Add the app
-            f.write(line)
-            in_installed_apps = False
-        else:
-            f.write(line)
-
-# Step 8: Modify views.py in the app
-views_path = "xtreme_admin/views.py"
-with open(views_path, "w") as f:
-    f.write("""
+with open(settings_path, "r") as src:
+    text = INSTALLED_APPS_RE.sub(r"\1    'xtreme_admin',\n]", src.read(), count=1)
+with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(settings_path), delete=False) as f:
+    tmp_path = f.name
+    try:
+        f.write(text)
+    except BaseException:
+        f.close()
+        os.unlink(tmp_path)
+        raise
+try:
+    shutil.copymode(settings_path, tmp_path)  # mkstemp creates 0600; keep the original permissions
+    os.replace(tmp_path, settings_path)
+except BaseException:
+    os.unlink(tmp_path)
+    raise
+
+# Steps 8, 9 and 11: Write the app's views.py, urls.py and welcome template in one batch
+template_dir = Path("xtreme_admin/templates")
+template_dir.mkdir(parents=True, exist_ok=True)
+app_files = [
+    # Step 8: views.py in the app
+    (Path("xtreme_admin/views.py"), """
 from django.shortcuts import render
 
 def welcome(request):
     return render(request, 'welcome.html')
-    """)
-
-# Step 9: Create urls.py in the app
-app_urls_path = "xtreme_admin/urls.py"
-with open(app_urls_path, "w") as f:
-    f.write("""
+    """),
+    # Step 9: urls.py in the app
+    (Path("xtreme_admin/urls.py"), """
 from django.urls import path
 from . import views
 
 urlpatterns = [
     path('', views.welcome, name='welcome'),
 ]
-    """)
+    """),
+    # Step 11: the template file
+    (template_dir / "welcome.html", """
+<h1>Welcome to Xtreme Admin</h1>
+    """),
+]
+for file_path, content in app_files:
+    file_path.write_text(content)
 
 # Step 10: Modify the project's urls.py to include the app's URLs (UPDATED FOR FIX)
 project_urls_path = "xtremeadmin/urls.py"
 with open(project_urls_path, "r") as f:
-    lines = f.readlines()
-
-# Improved check and insertion for 'from django.urls import include'
-if not any("include" in line and line.strip().startswith("from django.urls import") for line in lines):  # More precise check
-    import_indices = [i for i, line in enumerate(lines) if line.strip().startswith(("from", "import"))]
-    if import_indices:
-        insert_index = import_indices[-1] + 1  # Insert after the last import line
-    else:
-        insert_index = 0  # Insert at the beginning if no imports
-    lines.insert(insert_index, "from django.urls import include\n")  # Insert the import line
-
-# Now, build a new set of lines with the correct modification
-new_lines = []
-in_urlpatterns = False
-for line in lines:
-    if in_urlpatterns and line.strip().rstrip(',').endswith("]"):
-        new_lines.append("    path('', include('xtreme_admin.urls')),\n")  # Add inside the list
-    new_lines.append(line)  # Add the original line
-    if line.strip().startswith("urlpatterns = ["):
-        in_urlpatterns = True
-    elif in_urlpatterns and line.strip().endswith("],"):
-        in_urlpatterns = False
+    text = f.read()
 
-with open(project_urls_path, "w") as f:
-    f.writelines(new_lines)
-
-# Step 11: Create the template file
-template_dir = "xtreme_admin/templates"
-os.makedirs(template_dir, exist_ok=True)
-welcome_template_path = os.path.join(template_dir, "welcome.html")
-with open(welcome_template_path, "w") as f:
-    f.write("""
-<h1>Welcome to Xtreme Admin</h1>
-    """)
+# Add the app's route just before the closing bracket of urlpatterns
+match = URLPATTERNS_RE.search(text)
+if match:
+    close = text.find("\n]", match.end())
+    if close != -1:
+        text = text[:close + 1] + "    path('', include('xtreme_admin.urls')),\n" + text[close + 1:]
 
-# Step 12: Add `fastcore`
-print("Adding fastcore for Fast Tag support...")
-run_command(["uv", "pip", "install", "fastcore"])
+# Import `include` after the last import line (anchored, so the docstring's example import doesn't count)
+if not INCLUDE_IMPORT_RE.search(text):
+    imports = list(IMPORT_LINE_RE.finditer(text))
+    offset = imports[-1].end() + 1 if imports else 0
+    text = text[:offset] + "from django.urls import include\n" + text[offset:]
 
-# Step 13: Add `fastlite`
-print("Adding fastlite for Mini Data Spec support...")
-run_command(["uv", "pip", "install", "fastlite"])
+with open(project_urls_path, "w") as f:
+    f.write(text)
 
 print("Setup complete! You can now run the server with:")
 print(f"uv run xtremedjango/manage.py runserver")
@@ -1,43 +1,62 @@
-import functools
+from inspect import unwrap
+from sys import intern
+from types import MappingProxyType
 
-from django.utils.deprecation import MiddlewareMixin
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpResponse
-from fastcore.xml import FT
-import fastcore.xml
 
-REGISTRY = {}
+# @ft writes to the private dict; everyone else gets a read-only live view of it
+_REGISTRY = {}
+REGISTRY = MappingProxyType(_REGISTRY)
 
 
-class FastTagMiddleware(MiddlewareMixin):
-    def process_response(self, request, response):
-        if isinstance(response, FT):
-            rendered_xml = fastcore.xml.to_xml(response)
-            return HttpResponse(rendered_xml, content_type='text/html')
+class FastTagMiddleware:
+    # Native sync + async middleware: under ASGI the async path runs without a sync_to_async hop
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Imported once per middleware instance (Django builds the chain once at startup)
+        from fastcore.xml import FT, to_xml
+        self._ft_cls, self._to_xml = FT, to_xml
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self._is_async:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response, _response_cls=HttpResponse):
+        if isinstance(response, self._ft_cls):
+            # Compact output, as FT.__html__ renders: no per-level indent strings or newline joins
+            return _response_cls(self._to_xml(response, indent=False), content_type='text/html')
         return response
 
 
 def ft(path=None, *decorator_args, **decorator_kwargs):
+    registry = _REGISTRY
+
     def decorator(view_func):
-        # Handle potential previous wrapping
-        original_func = view_func
-        while hasattr(original_func, '__wrapped__'):
-            original_func = original_func.__wrapped__
+        # Handle potential previous wrapping (unwrap also guards against __wrapped__ cycles)
+        original_func = unwrap(view_func)
         
         # Determine path
-        final_path = path or '/' + original_func.__name__.lower() + '/'
+        final_path = intern(path or f'/{original_func.__name__.lower()}/')
         
         # Register the view
-        REGISTRY[final_path] = original_func
-        
-        # Preserve metadata and support chaining
-        @functools.wraps(original_func)
-        def wrapper(*args, **kwargs):
-            return original_func(*args, **kwargs)
+        registry[final_path] = original_func
         
-        wrapper.__wrapped__ = original_func
-        wrapper.ft_path = final_path
+        # No pass-through wrapper: tag the view itself and hand it back unchanged, which keeps
+        # its metadata and any outer decorators (e.g. login_required) and saves a frame per call
+        view_func.ft_path = final_path
         
-        return wrapper
+        return view_func
     
     return decorator
 